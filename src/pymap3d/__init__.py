@@ -52,6 +52,7 @@ from .latitude import (
     authalic2geodetic,
     geodetic2parametric,
     parametric2geodetic,
+    latitude_convert,
 )
 from .rcurve import geocentric_radius, rcurve_parallel, rcurve_meridian, rcurve_transverse
 from .rsphere import (
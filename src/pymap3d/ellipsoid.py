@@ -67,4 +67,5 @@ class Ellipsoid:
 
         self.flattening = (self.semimajor_axis - self.semiminor_axis) / self.semimajor_axis
         self.thirdflattening = (self.semimajor_axis - self.semiminor_axis) / (self.semimajor_axis + self.semiminor_axis)
-        self.eccentricity = sqrt(2 * self.flattening - self.flattening ** 2)
+        self.eccentricity_sq = 2 * self.flattening - self.flattening ** 2
+        self.eccentricity = sqrt(self.eccentricity_sq)
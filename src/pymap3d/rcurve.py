@@ -80,7 +80,7 @@ def rcurve_meridian(lat: "ndarray", ell: Ellipsoid = None, deg: bool = True) ->
     if deg:
         lat = radians(lat)
 
-    f1 = ell.semimajor_axis * (1 - ell.eccentricity ** 2)
+    f1 = ell.semimajor_axis * (1 - ell.eccentricity_sq)
     f2 = 1 - (ell.eccentricity * sin(lat)) ** 2
     return f1 / sqrt(f2 ** 3)
 
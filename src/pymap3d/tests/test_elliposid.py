@@ -16,7 +16,9 @@ xyz0 = (660e3, -4700e3, 4247e3)
     ],
 )
 def test_reference(model, f):
-    assert pm.Ellipsoid(model).flattening == approx(f)
+    ell = pm.Ellipsoid(model)
+    assert ell.flattening == approx(f)
+    assert ell.eccentricity_sq == approx(ell.eccentricity ** 2)
 
 
 def test_ellipsoid():
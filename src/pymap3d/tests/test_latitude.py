@@ -51,7 +51,9 @@ def test_geodetic_isometric(geodetic_lat, isometric_lat):
 def test_numpy_geodetic_isometric():
     pytest.importorskip("numpy")
     assert pm.geodetic2isometric([45, 0]) == approx([50.227466, 0])
+    assert pm.geodetic2isometric([90, -90]) == approx([inf, -inf])
     assert pm.isometric2geodetic([50.227466, 0]) == approx([45, 0])
+    assert pm.isometric2geodetic([inf, -inf]) == approx([90, -90])
 
 
 @pytest.mark.parametrize(
@@ -71,6 +73,7 @@ def test_geodetic_conformal(geodetic_lat, conformal_lat):
 def test_numpy_geodetic_conformal():
     pytest.importorskip("numpy")
     assert pm.geodetic2conformal([45, 0]) == approx([44.80768406, 0])
+    assert pm.geodetic2conformal([90, -90]) == approx([90, -90])
     assert pm.conformal2geodetic([44.80768406, 0]) == approx([45, 0])
 
 
@@ -142,3 +145,122 @@ def test_badvals(lat):
         pm.geodetic2parametric(lat)
     with pytest.raises(ValueError):
         pm.parametric2geodetic(lat)
+
+
+def test_numpy_badvals():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        pm.geodetic2isometric([0, 45, 91])
+    with pytest.raises(ValueError):
+        pm.geodetic2conformal([0, -91, 45])
+
+
+def test_numpy_float32():
+    np = pytest.importorskip("numpy")
+    lat = np.array([45, 0, 90, -90], dtype=np.float32)
+
+    for fun, expected in [
+        (pm.geodetic2isometric, [50.227466, 0, inf, -inf]),
+        (pm.isometric2geodetic, [41.170427, 0, 66.653476, -66.653476]),
+        (pm.geodetic2conformal, [44.80768406, 0, 90, -90]),
+        (pm.conformal2geodetic, [45.192315, 0, 90, -90]),
+    ]:
+        out = fun(lat)
+        assert out.dtype == np.float32
+        assert out == approx(expected, rel=1e-4)
+
+
+def test_numpy_float16_pole():
+    np = pytest.importorskip("numpy")
+
+    assert pm.geodetic2conformal(np.array([90, -90], dtype=np.float16)) == approx([90, -90])
+
+
+@pytest.mark.parametrize("model", ["wgs84", "jupiter"])
+@pytest.mark.parametrize("geodetic_lat", [-89, -45, 10, 60, 89])
+def test_conformal_roundtrip(model, geodetic_lat):
+    ell = pm.Ellipsoid(model)
+    clat = pm.geodetic2conformal(geodetic_lat, ell)
+    assert pm.conformal2geodetic(clat, ell) == approx(geodetic_lat, rel=0, abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    "kind,lat",
+    [
+        ("geodetic2isometric", [0, 45, 90, -90]),
+        ("isometric2geodetic", [0, 50.227466, -271.275]),
+        ("geodetic2conformal", [0, 45, 89, -90]),
+        ("conformal2geodetic", [0, 44.80768406, 90]),
+        ("geodetic2rectifying", [0, 45, 90]),
+        ("rectifying2geodetic", [0, 44.855682, -90]),
+        ("geodetic2authalic", [0, 45, -90]),
+        ("authalic2geodetic", [0, 44.87170288, 90]),
+        ("geodetic2parametric", [0, 45, 90]),
+        ("parametric2geodetic", [0, 44.9037878, -90]),
+    ],
+)
+def test_latitude_convert(kind, lat):
+    np = pytest.importorskip("numpy")
+    fun = getattr(pm, kind)
+
+    out = pm.latitude_convert(lat, kind)
+    assert out.dtype == np.float64
+    assert out == approx(fun(lat))
+    assert pm.latitude_convert(np.radians(lat), kind, deg=False) == approx(fun(np.radians(lat), deg=False))
+
+
+def test_latitude_convert_input_unchanged():
+    np = pytest.importorskip("numpy")
+
+    class Wrapper:
+        """array-like handing back its own buffer to ascontiguousarray()"""
+
+        def __init__(self, values):
+            self.values = values
+
+        def __array__(self, dtype=None, copy=None):
+            return self.values.copy() if copy else self.values
+
+    lat = np.array([10.0, 45.0])
+    pm.latitude_convert(lat, "geodetic2conformal")
+    assert lat.tolist() == [10.0, 45.0]
+
+    wrapped = Wrapper(np.array([10.0, 45.0]))
+    assert pm.latitude_convert(wrapped, "geodetic2conformal") == approx(pm.geodetic2conformal([10, 45]))
+    assert wrapped.values.tolist() == [10.0, 45.0]
+
+
+def test_latitude_convert_badvals():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        pm.latitude_convert([0, 91], "geodetic2conformal")
+    with pytest.raises(ValueError):
+        pm.latitude_convert([0], "geodetic2geocentric")
+
+
+def test_numpy_longdouble():
+    np = pytest.importorskip("numpy")
+    lat = np.array([45, 0], dtype=np.longdouble)
+
+    assert pm.geodetic2isometric(lat) == approx([50.227466, 0])
+    assert pm.geodetic2conformal(lat) == approx([44.80768406, 0])
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_numba_ufuncs(monkeypatch, dtype):
+    """the compiled ufuncs are only dispatched to for large arrays on several cores, so call them directly"""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    import pymap3d.latitude as latitude
+
+    monkeypatch.setattr(latitude, "_numba_min_size", 0)
+    lat = np.radians(np.array([45, 0, 90, -90], dtype=dtype))
+    e = pm.Ellipsoid().eccentricity
+
+    for kernel, array_fun, extra_args in [
+        (latitude._geodetic2isometric_kernel, latitude._geodetic2isometric_array, lambda dtype: (latitude._pole_tolerance(dtype),)),
+        (latitude._geodetic2conformal_kernel, latitude._geodetic2conformal_array, lambda dtype: ()),
+    ]:
+        out = latitude._numba_or_array(kernel, array_fun, extra_args)(lat, e)
+        assert out.dtype == lat.dtype
+        assert out == approx(array_fun(lat, e), rel=1e-6)
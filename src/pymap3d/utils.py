@@ -58,6 +58,11 @@ def sph2cart(az: "ndarray", el: "ndarray", r: "ndarray") -> typing.Tuple["ndarra
 
 
 def sanitize(lat: "ndarray", ell: Ellipsoid, deg: bool) -> typing.Tuple["ndarray", Ellipsoid]:
+    """
+    latitude to radians, with default ellipsoid
+
+    with Numpy, the whole array is converted and bounds-checked at once
+    """
     if ell is None:
         ell = Ellipsoid()
     if asarray is not None: